@@ -14,10 +14,15 @@ from pydantic import (
     field_validator,
     model_validator,
 )
+from pydantic.fields import FieldInfo
 
 
 BasyxModels = AssetAdministrationShell | Submodel | DictObjectStore
 
+_AAS_STD_ATTRS = frozenset(("id", "id_short", "description", "semantic_id"))
+# an AAS has no semantic id, so a field named semantic_id is a submodel of the AAS
+_AAS_RESERVED_ATTRS = frozenset(("id", "id_short", "description"))
+
 
 def string_does_start_with_a_character(v: str):
     assert v, "value must not be an empty string"
@@ -32,6 +37,59 @@ Reference = TypeVar(
 )
 
 
+class AttributeFieldInfo(typing.NamedTuple):
+    name: str
+    field_info: FieldInfo
+
+
+def _get_field_specs(
+    model_type: type[BaseModel], cache_attribute: str, skipped: typing.FrozenSet[str]
+) -> typing.Tuple[AttributeFieldInfo, ...]:
+    field_specs = model_type.__dict__.get(cache_attribute)
+    if field_specs is not None:
+        return field_specs
+    field_specs = tuple(
+        AttributeFieldInfo(field_name, field_info)
+        for field_name, field_info in model_type.model_fields.items()
+        if field_name not in skipped and not field_name.startswith("_")
+    )
+    if model_type.__pydantic_complete__:
+        setattr(model_type, cache_attribute, field_specs)
+    return field_specs
+
+
+def get_attribute_field_specs(
+    model_type: type[BaseModel],
+) -> typing.Tuple[AttributeFieldInfo, ...]:
+    """
+    Returns the fields of a model class that do not start with an underscore and are not standard attributes of the aas object. The fields are computed once and stored on the class as __aas_field_specs__ as soon as the class is complete, so that forward references are resolved.
+
+    Args:
+        model_type (type[BaseModel]): Model class to get the fields from
+
+    Returns:
+        typing.Tuple[AttributeFieldInfo, ...]: Fields of the model class
+    """
+    return _get_field_specs(model_type, "__aas_field_specs__", _AAS_STD_ATTRS)
+
+
+def _get_aas_submodel_field_specs(
+    model_type: type[BaseModel],
+) -> typing.Tuple[AttributeFieldInfo, ...]:
+    """
+    Returns the fields of an AAS class that are validated as submodels. In contrast to get_attribute_field_specs, a field named semantic_id is included, since an AAS has no semantic id.
+
+    Args:
+        model_type (type[BaseModel]): AAS class to get the fields from
+
+    Returns:
+        typing.Tuple[AttributeFieldInfo, ...]: Fields of the AAS class
+    """
+    return _get_field_specs(
+        model_type, "__aas_submodel_field_specs__", _AAS_RESERVED_ATTRS
+    )
+
+
 class Referable(BaseModel):
     """
     Base class for all referable classes of the AAS meta model. A Referable is an object with a local id (id_short) and a description.
@@ -44,6 +102,11 @@ class Referable(BaseModel):
     id_short: AasIdString
     description: str = ""
 
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        get_attribute_field_specs(cls)
+
 
 class Identifiable(Referable):
     """
@@ -96,12 +159,17 @@ class AAS(Identifiable):
         description (str, optional): Description of the object. Defaults to None.
     """
 
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        _get_aas_submodel_field_specs(cls)
+
     @model_validator(mode="before")
     @classmethod
     def set_optional_fields_to_None(cls, data):
         if isinstance(data, BaseModel):
             data = data.model_dump()
-        for field_name, field_info in cls.model_fields.items():
+        for field_name, field_info in _get_aas_submodel_field_specs(cls):
             if field_name in data:
                 continue
             if typing.get_origin(field_info.annotation) == Union and type(
@@ -112,10 +180,8 @@ class AAS(Identifiable):
 
     @model_validator(mode="after")
     def check_submodels(self) -> Any:
-        for field_name, field_info in self.model_fields.items():
-            if field_name in ["id", "id_short", "description"]:
-                continue
-            elif (
+        for field_name, field_info in _get_aas_submodel_field_specs(type(self)):
+            if (
                 typing.get_origin(field_info.annotation) == Union
                 and type(None) in typing.get_args(field_info.annotation)
                 and getattr(self, field_name) is None
@@ -168,9 +234,7 @@ class SubmodelElementCollection(HasSemantics, Referable):
 
     @model_validator(mode="after")
     def check_submodel_elements(self) -> Any:
-        for field_name in self.model_fields:
-            if field_name in ["id", "id_short", "description", "semantic_id"]:
-                continue
+        for field_name, _ in get_attribute_field_specs(type(self)):
             assert is_valid_submodel_element(
                 getattr(self, field_name)
             ), f"All attributes of a SubmodelElementCollection must be valid SubmodelElements. Field {field_name} is not valid."
@@ -217,9 +281,7 @@ class Submodel(HasSemantics, Identifiable):
 
     @model_validator(mode="after")
     def check_submodel_elements(self) -> Any:
-        for field_name in self.model_fields:
-            if field_name in ["id", "id_short", "description", "semantic_id"]:
-                continue
+        for field_name, _ in get_attribute_field_specs(type(self)):
             assert is_valid_submodel_element(
                 getattr(self, field_name)
             ), f"All attributes of a Submodel must be valid SubmodelElements."
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 import typing
 from pydantic import BaseModel, TypeAdapter
 
@@ -50,8 +51,32 @@ def get_types_name_dict(
     return types_name_dict
 
 
+def _map_with_workers(
+    function: typing.Callable[[typing.Any], typing.Any],
+    items: typing.List[typing.Any],
+    workers: typing.Optional[int],
+) -> typing.List[typing.Any]:
+    """
+    Applies a function to all items, either serially or in a thread pool. The order of the results matches the order of the items.
+
+    Args:
+        function (typing.Callable[[typing.Any], typing.Any]): Function to apply.
+        items (typing.List[typing.Any]): Items to apply the function to.
+        workers (typing.Optional[int]): Number of threads to use. 1 applies the function serially, None uses the default of ThreadPoolExecutor.
+
+    Returns:
+        typing.List[typing.Any]: Results of the function for all items.
+    """
+    if workers == 1 or len(items) < 2:
+        return [function(item) for item in items]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(function, items))
+
+
 def convert_object_store_to_pydantic_models(
-    obj_store: model.DictObjectStore, types: typing.List[type]
+    obj_store: model.DictObjectStore,
+    types: typing.List[type],
+    workers: typing.Optional[int] = 1,
 ) -> typing.List[aas_model.AAS]:
     """
     Converts an object store with AAS and submodels to pydantic models, representing the original data structure.
@@ -59,35 +84,48 @@ def convert_object_store_to_pydantic_models(
     Args:
         obj_store (model.DictObjectStore): Object store with AAS and submodels
         types (typing.List[type]): List of types to create the pydantic models from. Can be only top level types.
+        workers (typing.Optional[int], optional): Number of threads used to convert the submodels and AAS. Defaults to 1, which converts serially. None uses the default of ThreadPoolExecutor.
 
     Returns:
         typing.List[aas_model.AAS]: List of pydantic models
     """
     type_name_dict = get_types_name_dict(types)
 
-    pydantic_submodels: typing.List[aas_model.Submodel] = []
-    for identifiable in obj_store:
-        if not isinstance(identifiable, model.Submodel):
-            continue
+    def convert_submodel(identifiable: model.Submodel) -> aas_model.Submodel:
         class_name = convert_util.get_class_name_from_basyx_model(identifiable)
         if not class_name in type_name_dict:
             pass
-        pydantic_submodel = convert_submodel_to_model_instance(
+        return convert_submodel_to_model_instance(
             identifiable, type_name_dict[class_name]
         )
-        pydantic_submodels.append(pydantic_submodel)
 
-    pydantic_aas_list: typing.List[aas_model.AAS] = []
-    for identifiable in obj_store:
-        if not isinstance(identifiable, model.AssetAdministrationShell):
-            continue
+    pydantic_submodels: typing.List[aas_model.Submodel] = _map_with_workers(
+        convert_submodel,
+        [
+            identifiable
+            for identifiable in obj_store
+            if isinstance(identifiable, model.Submodel)
+        ],
+        workers,
+    )
+
+    def convert_aas(identifiable: model.AssetAdministrationShell) -> aas_model.AAS:
         class_name = convert_util.get_class_name_from_basyx_model(identifiable)
         if not class_name in type_name_dict:
             pass
-        pydantic_aas = convert_aas_to_pydantic_model_instance(
+        return convert_aas_to_pydantic_model_instance(
             identifiable, pydantic_submodels, type_name_dict[class_name]
         )
-        pydantic_aas_list.append(pydantic_aas)
+
+    pydantic_aas_list: typing.List[aas_model.AAS] = _map_with_workers(
+        convert_aas,
+        [
+            identifiable
+            for identifiable in obj_store
+            if isinstance(identifiable, model.AssetAdministrationShell)
+        ],
+        workers,
+    )
 
     return pydantic_aas_list
 
@@ -1,29 +1,27 @@
+import collections
 import datetime
-import json
+import functools
+import os
 from types import NoneType
 from typing import Any, Dict, List, Union
-import uuid
 from basyx.aas import model
 
 import typing
-import stringcase
 
 from basyx.aas.model import datatypes
-from pydantic import BaseModel, ConfigDict
 from pydantic.fields import FieldInfo
 
 from aas_pydantic import aas_model
+from aas_pydantic.aas_model import AttributeFieldInfo
 
 
-class AttributeFieldInfo(BaseModel):
+class AttributeInfo(typing.NamedTuple):
     name: str
     field_info: FieldInfo
-
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+    value: Any
 
 
-class AttributeInfo(AttributeFieldInfo):
-    value: Any
+_AAS_OR_SUBMODEL_TYPES = (aas_model.AAS, aas_model.Submodel)
 
 
 def get_attribute_field_infos(
@@ -32,25 +30,16 @@ def get_attribute_field_infos(
         type[aas_model.Submodel],
         type[aas_model.SubmodelElementCollection],
     ]
-) -> List[AttributeFieldInfo]:
+) -> typing.Tuple[AttributeFieldInfo, ...]:
     """
     Returns a dictionary of all attributes of an object that are not None, do not start with an underscore and are not standard attributes of the aas object.
 
     Args:
         obj (Union[aas_model.AAS, aas_model.Submodel, aas_model.SubmodelElementCollection]): Object to get the attributes from
     Returns:
-        List[AttributeFieldInfo]: List of attributes of the object
+        typing.Tuple[AttributeFieldInfo, ...]: Attributes of the object
     """
-    attribute_infos = []
-    for attribute_name, field_info in obj.model_fields.items():
-        if attribute_name in ["id", "description", "id_short", "semantic_id"]:
-            continue
-        if attribute_name.startswith("_"):
-            continue
-        attribute_infos.append(
-            AttributeFieldInfo(name=attribute_name, field_info=field_info)
-        )
-    return attribute_infos
+    return aas_model.get_attribute_field_specs(obj)
 
 
 def get_attribute_infos(
@@ -65,19 +54,13 @@ def get_attribute_infos(
     Returns:
         List[AttributeInfo]: List of attributes of the object
     """
-    attribute_infos = []
-    for attribute_name, field_info in obj.model_fields.items():
-        if attribute_name in ["id", "description", "id_short", "semantic_id"]:
-            continue
-        if attribute_name.startswith("_"):
-            continue
-        attribute_value = getattr(obj, attribute_name)
-        attribute_infos.append(
-            AttributeInfo(
-                name=attribute_name, field_info=field_info, value=attribute_value
-            )
-        )
-    return attribute_infos
+    return [
+        AttributeInfo(name, field_info, getattr(obj, name))
+        for name, field_info in aas_model.get_attribute_field_specs(type(obj))
+    ]
+
+
+_LANG_PREFS = ("en", "ger", "de")
 
 
 def get_str_description(langstring_set: model.LangStringSet) -> str:
@@ -90,14 +73,11 @@ def get_str_description(langstring_set: model.LangStringSet) -> str:
     """
     if not langstring_set:
         return ""
-    if "en" in langstring_set:
-        return str(langstring_set.get("en"))
-    elif "ger" in langstring_set:
-        return str(langstring_set.get("ger"))
-    elif "de" in langstring_set:
-        return str(langstring_set.get("de"))
-    else:
-        return str(langstring_set.get(list(langstring_set.keys())[0]))
+    for language in _LANG_PREFS:
+        description = langstring_set.get(language)
+        if description is not None:
+            return str(description)
+    return str(next(iter(langstring_set.values())))
 
 
 def get_basyx_description_from_model(
@@ -114,15 +94,74 @@ def get_basyx_description_from_model(
     Raises:
         ValueError: If the description of the model object is not a dict or a string
     """
-    if not model_object.description:
+    description = model_object.description
+    if not description:
         return None
-    try:
-        dict_description = json.loads(model_object.description)
-        if not isinstance(dict_description, dict):
-            raise ValueError
-    except ValueError:
-        dict_description = {"en": model_object.description}
-    return model.LangStringSet(dict_description)
+    # only json objects can be a dict description, plain strings skip json parsing
+    if description.lstrip().startswith("{"):
+        import json
+
+        try:
+            dict_description = json.loads(description)
+        except ValueError:
+            dict_description = None
+        if isinstance(dict_description, dict):
+            return model.LangStringSet(dict_description)
+    return model.LangStringSet({"en": description})
+
+
+_SPEC_INDEX_ATTRIBUTE = "_aas_pydantic_spec_index"
+
+
+def _build_spec_index(
+    item: typing.Union[
+        model.AssetAdministrationShell, model.Submodel, model.SubmodelElementCollection
+    ]
+) -> Dict[str, List[typing.Tuple[Any, typing.FrozenSet[str]]]]:
+    """
+    Returns an index of the IEC61360 data specifications of a basyx model, that maps the english preferred name of the data specification to its values and key values. The index is stored on the item together with the data specifications it was built from and is rebuilt as soon as any data specification of the item is added, removed or replaced. The data specifications themselves are not expected to be changed in place.
+
+    Args:
+        item (typing.Union[model.AssetAdministrationShell, model.Submodel, model.SubmodelElementCollection]): Basyx model to index the data specifications of
+
+    Returns:
+        Dict[str, List[typing.Tuple[Any, typing.FrozenSet[str]]]]: Index of the data specifications
+    """
+    data_specs = tuple(item.embedded_data_specifications)
+    cached_index = vars(item).get(_SPEC_INDEX_ATTRIBUTE)
+    if (
+        cached_index is not None
+        and len(cached_index[0]) == len(data_specs)
+        and all(
+            cached is current for cached, current in zip(cached_index[0], data_specs)
+        )
+    ):
+        return cached_index[1]
+    spec_index: Dict[str, List[typing.Tuple[Any, typing.FrozenSet[str]]]] = {}
+    for data_spec in data_specs:
+        content = data_spec.data_specification_content
+        if not isinstance(content, model.DataSpecificationIEC61360):
+            continue
+        key_values = frozenset(key.value for key in data_spec.data_specification.key)
+        spec_index.setdefault(content.preferred_name.get("en"), []).append(
+            (content.value, key_values)
+        )
+    vars(item)[_SPEC_INDEX_ATTRIBUTE] = (data_specs, spec_index)
+    return spec_index
+
+
+@functools.lru_cache(maxsize=4096)
+def _camel(value: str) -> str:
+    import stringcase
+
+    return stringcase.camelcase(value)
+
+
+@functools.lru_cache(maxsize=4096)
+def _snake(value: str) -> str:
+    import stringcase
+
+    return stringcase.snakecase(value)
 
 
 def get_class_name_from_basyx_model(
@@ -142,24 +181,17 @@ def get_class_name_from_basyx_model(
     Returns:
         str: Class name of the basyx model
     """
+    item_id_short = item.id_short
     if not item.embedded_data_specifications:
-        return item.id_short
-    for data_spec in item.embedded_data_specifications:
-        content = data_spec.data_specification_content
-        if not isinstance(content, model.DataSpecificationIEC61360):
-            continue
-        if not content.preferred_name.get("en") == "class":
-            continue
-        condition_smc = any(
-            key.value == item.id_short for key in data_spec.data_specification.key
-        )
-        condition_aas_sm = hasattr(item, "id") and any(
-            key.value == item.id for key in data_spec.data_specification.key
-        )
+        return item_id_short
+    item_id = getattr(item, "id", None)
+    for value, key_values in _build_spec_index(item).get("class", ()):
+        condition_smc = item_id_short in key_values
+        condition_aas_sm = item_id in key_values
         if not condition_smc and not condition_aas_sm:
             continue
 
-        return content.value
+        return value
     raise ValueError(
         f"No class name found in item with id {item.id_short} and type {type(item)}"
     )
@@ -181,7 +213,7 @@ def get_class_name_from_basyx_template(
         str: Class name of the basyx model
     """
     if not item.embedded_data_specifications:
-        return stringcase.camelcase(item.id_short)
+        return _camel(item.id_short)
     return get_class_name_from_basyx_model(item)
 
 
@@ -205,19 +237,12 @@ def get_attribute_name_from_basyx_model(
         str: The attribute name of the referenced item
     """
     if not item.embedded_data_specifications:
-        return stringcase.snakecase(referenced_item_id)
-    attribute_names = []
-    for data_spec in item.embedded_data_specifications:
-        content = data_spec.data_specification_content
-        if not isinstance(content, model.DataSpecificationIEC61360):
-            continue
-        if not any(
-            key.value == referenced_item_id for key in data_spec.data_specification.key
-        ):
-            continue
-        if not content.preferred_name.get("en") == "attribute":
-            continue
-        attribute_names.append(content.value)
+        return _snake(referenced_item_id)
+    attribute_names = [
+        value
+        for value, key_values in _build_spec_index(item).get("attribute", ())
+        if referenced_item_id in key_values
+    ]
     if attribute_names:
         return attribute_names
     raise ValueError(
@@ -245,10 +270,37 @@ def get_attribute_names_from_basyx_template(
         str: The attribute name of the referenced item
     """
     if not item.embedded_data_specifications:
-        return [stringcase.snakecase(referenced_item_id_short)]
+        return [_snake(referenced_item_id_short)]
     return get_attribute_name_from_basyx_model(item, referenced_item_id_short)
 
 
+def _lss(label: str) -> model.LangStringSet:
+    """
+    Returns a new english LangStringSet for the preferred name of a data specification. A new instance is created for every call, since LangStringSets are mutable and are handed out to the caller as part of the created data specifications.
+
+    Args:
+        label (str): English label of the data specification
+
+    Returns:
+        model.LangStringSet: Preferred name of the data specification
+    """
+    return model.LangStringSet({"en": label})
+
+
+@functools.lru_cache(maxsize=8192)
+def _global_ref_key(value: str) -> model.Key:
+    """
+    Returns a global reference key for a value. Keys are immutable in basyx, so equal keys are shared instead of being created for every data specification.
+
+    Args:
+        value (str): Value of the key
+
+    Returns:
+        model.Key: Global reference key
+    """
+    return model.Key(type_=model.KeyTypes.GLOBAL_REFERENCE, value=value)
+
+
 def get_data_specification_for_model_template(
     model_type: typing.Union[
         type[aas_model.AAS],
@@ -259,15 +311,10 @@ def get_data_specification_for_model_template(
     return [
         model.EmbeddedDataSpecification(
             data_specification=model.ExternalReference(
-                key=(
-                    model.Key(
-                        type_=model.KeyTypes.GLOBAL_REFERENCE,
-                        value=(get_template_id(model_type)),
-                    ),
-                ),
+                key=(_global_ref_key(get_template_id(model_type)),),
             ),
             data_specification_content=model.DataSpecificationIEC61360(
-                preferred_name=model.LangStringSet({"en": "class"}),
+                preferred_name=_lss("class"),
                 value=get_template_id(model_type),
             ),
         )
@@ -283,26 +330,45 @@ def get_data_specification_for_model(
         model.EmbeddedDataSpecification(
             data_specification=model.ExternalReference(
                 key=(
-                    model.Key(
-                        type_=model.KeyTypes.GLOBAL_REFERENCE,
-                        value=(
-                            item.id
-                            if isinstance(
-                                item, typing.Union[aas_model.AAS, aas_model.Submodel]
-                            )
-                            else item.id_short
-                        ),
+                    _global_ref_key(
+                        item.id
+                        if isinstance(item, _AAS_OR_SUBMODEL_TYPES)
+                        else item.id_short
                     ),
                 ),
             ),
             data_specification_content=model.DataSpecificationIEC61360(
-                preferred_name=model.LangStringSet({"en": "class"}),
+                preferred_name=_lss("class"),
                 value=item.__class__.__name__.split(".")[-1],
             ),
         )
     ]
 
 
+_UUID_POOL: collections.deque[str] = collections.deque()
+_POOL_SIZE = 256
+# a forked child must not hand out the same prefetched values as its parent
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_UUID_POOL.clear)
+
+
+def _next_uuid_hex() -> str:
+    """
+    Returns a random 32 character hex string. The random bytes are read in batches for _POOL_SIZE values to avoid one os.urandom call per value.
+
+    Returns:
+        str: Random hex string
+    """
+    try:
+        return _UUID_POOL.popleft()
+    except IndexError:
+        buffer = os.urandom(16 * _POOL_SIZE)
+        _UUID_POOL.extend(
+            buffer[i * 16 : (i + 1) * 16].hex() for i in range(_POOL_SIZE)
+        )
+        return _UUID_POOL.popleft()
+
+
 def get_model_keys_for_data_specification(
     item: typing.Union[
         NoneType, aas_model.AAS, aas_model.Submodel, aas_model.SubmodelElementCollection
@@ -312,21 +378,58 @@ def get_model_keys_for_data_specification(
         return (
             model.Key(
                 type_=model.KeyTypes.GLOBAL_REFERENCE,
-                value=uuid.uuid4().hex,
+                value=_next_uuid_hex(),
             ),
         )
     return (
-        model.Key(
-            type_=model.KeyTypes.GLOBAL_REFERENCE,
-            value=(
-                item.id
-                if isinstance(item, typing.Union[aas_model.AAS, aas_model.Submodel])
-                else item.id_short
-            ),
+        _global_ref_key(
+            item.id if isinstance(item, _AAS_OR_SUBMODEL_TYPES) else item.id_short
         ),
     )
 
 
+class _AnnotationClassification(typing.NamedTuple):
+    origin: Any
+    args: typing.Tuple[Any, ...]
+    is_union: bool
+    is_optional: bool
+    non_none_args: typing.Tuple[Any, ...]
+    is_tuple: bool
+
+
+# Unions with the same arguments in different order compare equal and share a cache
+# entry, so the order of args and non_none_args must not be relied on.
+@functools.lru_cache(maxsize=2048)
+def _classify_annotation_cached(annotation: Any) -> _AnnotationClassification:
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+    is_union = origin is Union
+    return _AnnotationClassification(
+        origin=origin,
+        args=args,
+        is_union=is_union,
+        is_optional=is_union and NoneType in args,
+        non_none_args=tuple(arg for arg in args if arg is not NoneType),
+        is_tuple=origin is tuple,
+    )
+
+
+def _classify_annotation(annotation: Any) -> _AnnotationClassification:
+    """
+    Returns the typing origin and arguments of an annotation together with the checks derived from them. Results are cached per annotation, unhashable annotations are classified without caching.
+
+    Args:
+        annotation (Any): Annotation of a model field
+
+    Returns:
+        _AnnotationClassification: Classification of the annotation
+    """
+    try:
+        return _classify_annotation_cached(annotation)
+    except TypeError:
+        return _classify_annotation_cached.__wrapped__(annotation)
+
+
 def get_data_specification_for_attribute(
     attribute_field_info: AttributeFieldInfo, basyx_attribute: Any
 ) -> model.EmbeddedDataSpecification:
@@ -336,7 +439,7 @@ def get_data_specification_for_attribute(
             key=model_keys,
         ),
         data_specification_content=model.DataSpecificationIEC61360(
-            preferred_name=model.LangStringSet({"en": "attribute"}),
+            preferred_name=_lss("attribute"),
             value=attribute_field_info.name,
         ),
     )
@@ -345,10 +448,7 @@ def get_data_specification_for_attribute(
 def get_optional_data_specification_for_attribute(
     attribute_field_info: AttributeFieldInfo,
 ) -> typing.Optional[model.EmbeddedDataSpecification]:
-    if not (
-        typing.get_origin(attribute_field_info.field_info.annotation) is Union
-        and type(None) in typing.get_args(attribute_field_info.field_info.annotation)
-    ):
+    if not _classify_annotation(attribute_field_info.field_info.annotation).is_optional:
         return
     model_keys = get_model_keys_for_data_specification()
 
@@ -357,7 +457,7 @@ def get_optional_data_specification_for_attribute(
             key=model_keys,
         ),
         data_specification_content=model.DataSpecificationIEC61360(
-            preferred_name=model.LangStringSet({"en": "optional"}),
+            preferred_name=_lss("optional"),
             value=attribute_field_info.name,
         ),
     )
@@ -372,7 +472,7 @@ def get_immutable_data_specification_for_attribute_name(
             key=model_keys,
         ),
         data_specification_content=model.DataSpecificationIEC61360(
-            preferred_name=model.LangStringSet({"en": "immutable"}),
+            preferred_name=_lss("immutable"),
             value=attribute_name,
         ),
     )
@@ -381,7 +481,7 @@ def get_immutable_data_specification_for_attribute_name(
 def get_immutable_data_specification_for_attribute(
     attribute_field_info: AttributeFieldInfo,
 ) -> typing.Optional[model.EmbeddedDataSpecification]:
-    if not typing.get_origin(attribute_field_info.field_info.annotation) == tuple:
+    if not _classify_annotation(attribute_field_info.field_info.annotation).is_tuple:
         return
     return get_immutable_data_specification_for_attribute_name(
         attribute_field_info.name
@@ -400,7 +500,7 @@ def get_default_data_specification_for_attribute(
             key=model_keys,
         ),
         data_specification_content=model.DataSpecificationIEC61360(
-            preferred_name=model.LangStringSet({"en": "default"}),
+            preferred_name=_lss("default"),
             value=attribute_field_info.field_info.default,
         ),
     )
@@ -409,17 +509,8 @@ def get_default_data_specification_for_attribute(
 def get_union_data_specification_for_attribute(
     attribute_field_info: AttributeFieldInfo,
 ) -> typing.Optional[model.EmbeddedDataSpecification]:
-    if not (
-        typing.get_origin(attribute_field_info.field_info.annotation) == Union
-        and len(
-            [
-                arg
-                for arg in typing.get_args(attribute_field_info.field_info.annotation)
-                if arg != NoneType
-            ]
-        )
-        > 1
-    ):
+    classification = _classify_annotation(attribute_field_info.field_info.annotation)
+    if not (classification.is_union and len(classification.non_none_args) > 1):
         return
     model_keys = get_model_keys_for_data_specification()
 
@@ -428,7 +519,7 @@ def get_union_data_specification_for_attribute(
             key=model_keys,
         ),
         data_specification_content=model.DataSpecificationIEC61360(
-            preferred_name=model.LangStringSet({"en": "union"}),
+            preferred_name=_lss("union"),
             value=attribute_field_info.name,
         ),
     )
@@ -452,17 +543,9 @@ def get_default_value_from_basyx_model(
     """
     if not item.embedded_data_specifications:
         return
-    for data_spec in item.embedded_data_specifications:
-        content = data_spec.data_specification_content
-        if not isinstance(content, model.DataSpecificationIEC61360):
-            continue
-        if not (content.preferred_name.get("en") == "default"):
-            continue
-        if not any(
-            key.value == attribute_id for key in data_spec.data_specification.key
-        ):
-            continue
-        return content.value
+    for value, key_values in _build_spec_index(item).get("default", ()):
+        if attribute_id in key_values:
+            return value
     return
 
 
@@ -487,13 +570,8 @@ def is_attribute_from_basyx_model_immutable(
     """
     if not item.embedded_data_specifications:
         return False
-    for data_spec in item.embedded_data_specifications:
-        content = data_spec.data_specification_content
-        if not isinstance(content, model.DataSpecificationIEC61360):
-            continue
-        if not content.preferred_name.get("en") == "immutable":
-            continue
-        return content.value == attribute_name
+    for value, _ in _build_spec_index(item).get("immutable", ()):
+        return value == attribute_name
     return False
 
 
@@ -515,17 +593,10 @@ def is_optional_attribute_type(
     """
     if not item.embedded_data_specifications:
         return True
-    for data_spec in item.embedded_data_specifications:
-        content = data_spec.data_specification_content
-        if not isinstance(content, model.DataSpecificationIEC61360):
-            continue
-        if not (
-            content.preferred_name.get("en") == "optional"
-            and content.value == attribute_name
-        ):
-            continue
-        return True
-    return False
+    return any(
+        value == attribute_name
+        for value, _ in _build_spec_index(item).get("optional", ())
+    )
 
 
 def is_union_attribute_type(
@@ -546,17 +617,9 @@ def is_union_attribute_type(
     """
     if not item.embedded_data_specifications:
         return False
-    for data_spec in item.embedded_data_specifications:
-        content = data_spec.data_specification_content
-        if not isinstance(content, model.DataSpecificationIEC61360):
-            continue
-        if not (
-            content.preferred_name.get("en") == "union"
-            and content.value == attribute_name
-        ):
-            continue
-        return True
-    return False
+    return any(
+        value == attribute_name for value, _ in _build_spec_index(item).get("union", ())
+    )
 
 
 def get_template_id(
@@ -592,9 +655,21 @@ def get_semantic_id(
     return semantic_id
 
 
+_VALUE_TYPE_MAP = {
+    bool: datatypes.Boolean,
+    int: datatypes.Integer,
+    float: datatypes.Double,
+    str: datatypes.String,
+}
+
+
 def get_value_type_of_attribute(
     attribute: Union[str, int, float, bool]
 ) -> model.datatypes:
+    value_type = _VALUE_TYPE_MAP.get(type(attribute))
+    if value_type is not None:
+        return value_type
+    # subclasses of the primitive types, e.g. IntEnum members
     if isinstance(attribute, bool):
         return model.datatypes.Boolean
     elif isinstance(attribute, int):
@@ -624,83 +699,64 @@ def get_semantic_id_value_of_model(
     return basyx_model.semantic_id.key[0].value
 
 
+# TODO: implement GyearMonth, GYer, GMonthDay, GDay, GMonth
+_XSD_TO_PRIMITIVE_TYPE: Dict[model.DataTypeDefXsd, type] = {
+    datatypes.Duration: str,
+    datatypes.DateTime: datetime.datetime,
+    datatypes.Date: datetime.datetime,
+    datatypes.Time: datetime.time,
+    datatypes.Boolean: bool,
+    datatypes.Base64Binary: bytes,
+    datatypes.HexBinary: bytes,
+    datatypes.Float: float,
+    datatypes.Double: float,
+    datatypes.Decimal: float,
+    datatypes.Integer: int,
+    datatypes.Long: int,
+    datatypes.Int: int,
+    datatypes.Short: int,
+    datatypes.Byte: int,
+    datatypes.NonPositiveInteger: int,
+    datatypes.NegativeInteger: int,
+    datatypes.NonNegativeInteger: int,
+    datatypes.PositiveInteger: int,
+    datatypes.UnsignedLong: int,
+    datatypes.UnsignedInt: int,
+    datatypes.UnsignedShort: int,
+    datatypes.UnsignedByte: int,
+    datatypes.AnyURI: str,
+    datatypes.String: str,
+    datatypes.NormalizedString: str,
+}
+
+_PRIMITIVE_TYPE_TO_XSD: Dict[type, model.DataTypeDefXsd] = {
+    str: datatypes.String,
+    datetime.datetime: datatypes.DateTime,
+    datetime.time: datatypes.Time,
+    bool: datatypes.Boolean,
+    bytes: datatypes.Base64Binary,
+    float: datatypes.Double,
+    int: datatypes.Integer,
+}
+
+
 def convert_xsdtype_to_primitive_type(
     xsd_data_type: model.DataTypeDefXsd,
 ) -> aas_model.PrimitiveSubmodelElement:
-    if xsd_data_type == datatypes.Duration:
-        return str
-    elif xsd_data_type == datatypes.DateTime:
-        return datetime.datetime
-    elif xsd_data_type == datatypes.Date:
-        return datetime.datetime
-    elif xsd_data_type == datatypes.Time:
-        return datetime.time
-    # TODO: implement GyearMonth, GYer, GMonthDay, GDay, GMonth
-    elif xsd_data_type == datatypes.Boolean:
-        return bool
-    elif xsd_data_type == datatypes.Base64Binary:
-        return bytes
-    elif xsd_data_type == datatypes.HexBinary:
-        return bytes
-    elif xsd_data_type == datatypes.Float:
-        return float
-    elif xsd_data_type == datatypes.Double:
-        return float
-    elif xsd_data_type == datatypes.Decimal:
-        return float
-    elif xsd_data_type == datatypes.Integer:
-        return int
-    elif xsd_data_type == datatypes.Long:
-        return int
-    elif xsd_data_type == datatypes.Int:
-        return int
-    elif xsd_data_type == datatypes.Short:
-        return int
-    elif xsd_data_type == datatypes.Byte:
-        return int
-    elif xsd_data_type == datatypes.NonPositiveInteger:
-        return int
-    elif xsd_data_type == datatypes.NegativeInteger:
-        return int
-    elif xsd_data_type == datatypes.NonNegativeInteger:
-        return int
-    elif xsd_data_type == datatypes.PositiveInteger:
-        return int
-    elif xsd_data_type == datatypes.UnsignedLong:
-        return int
-    elif xsd_data_type == datatypes.UnsignedInt:
-        return int
-    elif xsd_data_type == datatypes.UnsignedShort:
-        return int
-    elif xsd_data_type == datatypes.UnsignedByte:
-        return int
-    elif xsd_data_type == datatypes.AnyURI:
-        return str
-    elif xsd_data_type == datatypes.String:
-        return str
-    elif xsd_data_type == datatypes.NormalizedString:
-        return str
+    return _XSD_TO_PRIMITIVE_TYPE.get(xsd_data_type)
 
 
 def convert_primitive_type_to_xsdtype(
     primitive_type: aas_model.PrimitiveSubmodelElement,
 ) -> model.DataTypeDefXsd:
-    if primitive_type == str:
-        return datatypes.String
-    elif primitive_type == datetime.datetime:
-        return datatypes.DateTime
-    elif primitive_type == datetime.time:
-        return datatypes.Time
-    elif primitive_type == bool:
-        return datatypes.Boolean
-    elif primitive_type == bytes:
-        return datatypes.Base64Binary
-    elif primitive_type == float:
-        return datatypes.Double
-    elif primitive_type == int:
-        return datatypes.Integer
-    else:
-        raise NotImplementedError("Type not implemented:", primitive_type)
+    try:
+        return _PRIMITIVE_TYPE_TO_XSD[primitive_type]
+    except KeyError:
+        raise NotImplementedError("Type not implemented:", primitive_type) from None
+
+
+_GEN_SMEC_PREFIX = "generated_submodel_list_hack_"
+_TEMP_ATTR_PREFIX = "temp_id_short_attribute"
 
 
 def unpatch_id_short_from_temp_attribute(smec: model.SubmodelElementCollection):
@@ -710,13 +766,13 @@ def unpatch_id_short_from_temp_attribute(smec: model.SubmodelElementCollection):
     Args:
         sm_element (model.SubmodelElementCollection): SubmodelElementCollection to unpatch.
     """
-    if not smec.id_short.startswith("generated_submodel_list_hack_"):
+    if not smec.id_short.startswith(_GEN_SMEC_PREFIX):
         return smec
     no_temp_values = []
     id_short = None
     for sm_element in smec.value:
         if isinstance(sm_element, model.Property) and sm_element.id_short.startswith(
-            "temp_id_short_attribute"
+            _TEMP_ATTR_PREFIX
         ):
             id_short = sm_element.value
             continue
@@ -729,6 +785,8 @@ def unpatch_id_short_from_temp_attribute(smec: model.SubmodelElementCollection):
         smec.id_short = new_id_short
         return smec
 
+    # The values need to be detached from smec before they can be added to the new
+    # collection, removing from the id_short keyed NamespaceSet is a dict lookup.
     for value in no_temp_values:
         smec.value.remove(value)
     new_smec = model.SubmodelElementCollection(
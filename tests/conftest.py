@@ -1,16 +1,20 @@
 from __future__ import annotations
+import functools
+import os
+import pickle
 from enum import Enum
-from typing import Any, List, Literal, Optional, Set, Tuple, Type, Union
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Literal, Optional, Set, Tuple, Type, Union
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 import pytest
 
 from aas_pydantic.aas_model import (
     AAS,
+    Identifiable,
     Submodel,
     SubmodelElementCollection,
     Reference,
-    AasIdString
 )
 
 class ExampleEnum(str, Enum):
@@ -45,6 +49,8 @@ class ExampleSEC(SubmodelElementCollection):
 
 
 class ExampleSubmodel(Submodel):
+    model_config = ConfigDict(defer_build=True)
+
     integer_attribute: int
     string_attribute: str
     float_attribute: float
@@ -61,6 +67,8 @@ class ExampleSubmodel(Submodel):
 
 
 class ExampleSubmodel2(Submodel):
+    model_config = ConfigDict(defer_build=True)
+
     integer_attribute: int
     string_attribute: str
     float_attribute: float
@@ -90,7 +98,18 @@ class ExampleSubmodelWithIdReference(Submodel):
     referenced_aas_set_ids: Set[str]
 
 
+class ValidAAS(AAS):
+    model_config = ConfigDict(defer_build=True)
+
+    example_submodel: ExampleSubmodel
+    example_submodel_2: ExampleSubmodel2
+    union_submodel: Union[ExampleSubmodel, ExampleSubmodel2]
+    optional_submodel: Optional[ExampleSubmodel]
+
+
 class ExampleBasemodelWithAssociation(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     id_short: str
     aas_reference: ValidAAS
     aas_list_reference: List[ValidAAS]
@@ -111,6 +130,19 @@ class ExampleBaseMdelWithId(BaseModel):
 
 
 class ObjectBomWithId:
+    __slots__ = (
+        "id",
+        "integer_attribute",
+        "string_attribute",
+        "float_attribute",
+        "literal_attribute",
+        "enum_attribute",
+        "list_attribute",
+        "tuple_attribute",
+        "set_attribute",
+        "union_attribute",
+    )
+
     def __init__(
         self,
         id: str,
@@ -142,6 +174,8 @@ class BaseModelWithIdentifierAttribute(BaseModel):
 
 
 class ObjectWithIdentifierAttribute:
+    __slots__ = ("other_name_id_attribute", "id")
+
     def __init__(
         self,
         other_name_id_attribute: str,
@@ -151,173 +185,252 @@ class ObjectWithIdentifierAttribute:
         self.id = id
 
 
-class ValidAAS(AAS):
-    example_submodel: ExampleSubmodel
-    example_submodel_2: ExampleSubmodel2
-    union_submodel: Union[ExampleSubmodel, ExampleSubmodel2]
-    optional_submodel: Optional[ExampleSubmodel]
-
-
 class FaultyAas(AAS):
     example_string_value: str
 
 
+class FaultyAasWithSemanticId(AAS):
+    semantic_id: str
+
+
+_STRING1 = "string1"
+_STRING2 = "string2"
+_STRING = "string"
+_VALUE1 = "value1"
+_REFERENCED_AAS_1_ID = "referenced_aas_1_id"
+_REFERENCED_AAS_2_ID = "referenced_aas_2_id"
+
+_COMMON_ATTRS = MappingProxyType(
+    {
+        "integer_attribute": 1,
+        "string_attribute": _STRING,
+        "float_attribute": 1.1,
+        "literal_attribute": _VALUE1,
+        "enum_attribute": ExampleEnum.value1,
+        "union_attribute": _STRING,
+    }
+)
+_mk_list = lambda: [_STRING1, _STRING2]
+_SET_VAL = frozenset((_STRING1, _STRING2))
+_mk_set = lambda: set(_SET_VAL)
+
+_VALIDATORS: Dict[Type[BaseModel], Callable[[Any], BaseModel]] = {}
+
+
+def _validator(model_type: Type[BaseModel]) -> Callable[[Any], BaseModel]:
+    """
+    Returns the cached validate_python of a model class. Classes with deferred schema building are rebuilt on first use.
+    """
+    validate = _VALIDATORS.get(model_type)
+    if validate is None:
+        if not model_type.__pydantic_complete__:
+            model_type.model_rebuild()
+        validate = model_type.__pydantic_validator__.validate_python
+        _VALIDATORS[model_type] = validate
+    return validate
+
+
+FAST_FIXTURES = os.environ.get("AAS_FAST_FIXTURES") == "1"
+
+
+def _build(model_type: Type[BaseModel], **data: Any) -> BaseModel:
+    """
+    Builds a fixture model with the cached validator of its class. If AAS_FAST_FIXTURES=1 is set, validation is skipped with model_construct, since the fixture data is hard-coded and trusted. Validators are not run in this case, so the id of identifiables is set from the id_short.
+    """
+    if not FAST_FIXTURES:
+        return _validator(model_type)(data)
+    if issubclass(model_type, Identifiable):
+        data.setdefault("id", data["id_short"])
+    return model_type.model_construct(**data)
+
+
+def _fresh(obj: BaseModel) -> BaseModel:
+    """
+    Returns a deep copy of a session scoped fixture for tests that mutate it. Pickling restores the model without validation and is faster than model_copy(deep=True) for the nested example models.
+    """
+    return pickle.loads(pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+_TEMPLATE_SIMPLE = _build(
+    SimpleExampleSEC,
+    id_short="template_simple_submodel_element_collection_id",
+    **_COMMON_ATTRS,
+    list_attribute=_mk_list(),
+    tuple_attribute=(_STRING1, _STRING2),
+    set_attribute=_mk_set(),
+)
+_TEMPLATE_EXAMPLE_SEC = _build(
+    ExampleSEC,
+    id_short="template_example_submodel_element_collection_id",
+    **_COMMON_ATTRS,
+    list_attribute=_mk_list(),
+    tuple_attribute=(_STRING1, _STRING2),
+    set_attribute=_mk_set(),
+    submodel_element_collection_attribute=_TEMPLATE_SIMPLE,
+)
+
+
+def _from_template(template: BaseModel, id_short: str, **update: Any) -> BaseModel:
+    """
+    Returns a shallow copy of a validated template model with a new id_short. The list and set attributes are replaced, so that fixtures do not share mutable containers.
+    """
+    return template.model_copy(
+        update={
+            "id_short": id_short,
+            "list_attribute": _mk_list(),
+            "set_attribute": _mk_set(),
+            **update,
+        }
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _build_simple(id_short: str) -> SimpleExampleSEC:
+    return _from_template(_TEMPLATE_SIMPLE, id_short)
+
+
+@functools.lru_cache(maxsize=None)
+def _build_submodel_with_reference(id_short: str) -> ExampleSubmodelWithReference:
+    return _build(
+        ExampleSubmodelWithReference,
+        id_short=id_short,
+        single_reference=_REFERENCED_AAS_1_ID,
+        list_references=[_REFERENCED_AAS_1_ID, _REFERENCED_AAS_2_ID],
+        tuple_references=(_REFERENCED_AAS_1_ID, _REFERENCED_AAS_2_ID),
+        set_references={_REFERENCED_AAS_1_ID, _REFERENCED_AAS_2_ID},
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _build_submodel_with_id_reference(id_short: str) -> ExampleSubmodelWithIdReference:
+    return _build(
+        ExampleSubmodelWithIdReference,
+        id_short=id_short,
+        referenced_aas_id=_REFERENCED_AAS_1_ID,
+        referenced_aas_ids=[_REFERENCED_AAS_1_ID, _REFERENCED_AAS_2_ID],
+        referenced_aas_tuple_ids=(_REFERENCED_AAS_1_ID, _REFERENCED_AAS_2_ID),
+        referenced_aas_set_ids={_REFERENCED_AAS_1_ID, _REFERENCED_AAS_2_ID},
+    )
+
+
+def pytest_sessionfinish(session: pytest.Session, exitstatus: int) -> None:
+    _build_simple.cache_clear()
+    _build_submodel_with_reference.cache_clear()
+    _build_submodel_with_id_reference.cache_clear()
+
+
 @pytest.fixture(scope="function")
 def faulty_aas() -> Type[FaultyAas]:
     return FaultyAas
 
 
 @pytest.fixture(scope="function")
+def faulty_aas_with_semantic_id() -> Type[FaultyAasWithSemanticId]:
+    return FaultyAasWithSemanticId
+
+
+@pytest.fixture(scope="session")
 def simple_submodel_element_collection() -> SubmodelElementCollection:
-    return SimpleExampleSEC(
-        id_short="simple_submodel_element_collection_id",
-        integer_attribute=1,
-        string_attribute="string",
-        float_attribute=1.1,
-        literal_attribute="value1",
-        enum_attribute=ExampleEnum.value1,
-        list_attribute=["string1", "string2"],
-        tuple_attribute=("string1", "string2"),
-        set_attribute={"string1", "string2"},
-        union_attribute="string",
-    )
+    return _build_simple("simple_submodel_element_collection_id")
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def example_submodel_element_collection(simple_submodel_element_collection: SubmodelElementCollection) -> SubmodelElementCollection:
-    return ExampleSEC(
-        id_short="example_submodel_element_collection_id",
-        integer_attribute=1,
-        string_attribute="string",
-        float_attribute=1.1,
-        literal_attribute="value1",
-        enum_attribute=ExampleEnum.value1,
-        list_attribute=["string1", "string2"],
-        tuple_attribute=("string1", "string2"),
-        set_attribute={"string1", "string2"},
-        union_attribute="string",
+    return _from_template(
+        _TEMPLATE_EXAMPLE_SEC,
+        "example_submodel_element_collection_id",
         submodel_element_collection_attribute=simple_submodel_element_collection,
     )
 
-@pytest.fixture(scope="function")
+
+@pytest.fixture(scope="session")
 def example_submodel_element_collection_for_union(simple_submodel_element_collection: SubmodelElementCollection) -> SubmodelElementCollection:
-    return ExampleSEC(
-        id_short="example_submodel_element_collection_for_union_id",
-        integer_attribute=1,
-        string_attribute="string",
-        float_attribute=1.1,
-        literal_attribute="value1",
-        enum_attribute=ExampleEnum.value1,
-        list_attribute=["string1", "string2"],
-        tuple_attribute=("string1", "string2"),
-        set_attribute={"string1", "string2"},
-        union_attribute="string",
+    return _from_template(
+        _TEMPLATE_EXAMPLE_SEC,
+        "example_submodel_element_collection_for_union_id",
         submodel_element_collection_attribute=simple_submodel_element_collection,
     )
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def example_list_submodel_element_collection(simple_submodel_element_collection: SubmodelElementCollection) -> List[SubmodelElementCollection]:
     return [simple_submodel_element_collection]
 
 
-@pytest.fixture(scope="function")
-def example_submodel(simple_submodel_element_collection: SubmodelElementCollection, example_submodel_element_collection: SubmodelElementCollection, example_submodel_element_collection_for_union: SubmodelElementCollection, example_list_submodel_element_collection: List[SubmodelElementCollection]) -> Submodel:
-    return ExampleSubmodel(
-        id_short="example_submodel_id",
-        description="Example Submodel",
-        integer_attribute=1,
-        string_attribute="string",
-        float_attribute=1.1,
-        literal_attribute="value1",
-        enum_attribute=ExampleEnum.value1,
-        list_attribute=["string1_list", "string2_list"],
-        tuple_attribute=("string1_tuple", "string2_tuple"),
-        set_attribute={"string1_set", "string2_set"},
-        union_attribute="string",
-        submodel_element_collection_attribute_simple=simple_submodel_element_collection,
-        submodel_element_collection_attribute=example_submodel_element_collection,
-        union_submodel_element_collection_attribute=example_submodel_element_collection_for_union,
-        list_submodel_element_collection_attribute=example_list_submodel_element_collection,
-    )
+@pytest.fixture(scope="session")
+def example_list_submodel_element_collection_factory(simple_submodel_element_collection: SubmodelElementCollection) -> Callable[[], List[SubmodelElementCollection]]:
+    return lambda: [simple_submodel_element_collection]
+
+
+@pytest.fixture(scope="session")
+def _submodel_factory(simple_submodel_element_collection: SubmodelElementCollection, example_submodel_element_collection: SubmodelElementCollection, example_submodel_element_collection_for_union: SubmodelElementCollection, example_list_submodel_element_collection: List[SubmodelElementCollection]) -> Callable[..., ExampleSubmodel]:
+    def make(id_short: str, **data: Any) -> ExampleSubmodel:
+        return _build(
+            ExampleSubmodel,
+            id_short=id_short,
+            **data,
+            **_COMMON_ATTRS,
+            list_attribute=["string1_list", "string2_list"],
+            tuple_attribute=("string1_tuple", "string2_tuple"),
+            set_attribute={"string1_set", "string2_set"},
+            submodel_element_collection_attribute_simple=simple_submodel_element_collection,
+            submodel_element_collection_attribute=example_submodel_element_collection,
+            union_submodel_element_collection_attribute=example_submodel_element_collection_for_union,
+            list_submodel_element_collection_attribute=example_list_submodel_element_collection,
+        )
+
+    return make
+
+
+@pytest.fixture(scope="session")
+def _canonical_submodel(_submodel_factory: Callable[..., ExampleSubmodel]) -> ExampleSubmodel:
+    return _submodel_factory("example_submodel_id", description="Example Submodel")
+
 
 @pytest.fixture(scope="function")
+def example_submodel(_canonical_submodel: ExampleSubmodel) -> Submodel:
+    return _fresh(_canonical_submodel)
+
+
+@pytest.fixture(scope="session")
 def example_submodel_2(simple_submodel_element_collection: SubmodelElementCollection, example_submodel_element_collection: SubmodelElementCollection, example_submodel_element_collection_for_union: SubmodelElementCollection, example_list_submodel_element_collection: List[SubmodelElementCollection]) -> Submodel:
-    return ExampleSubmodel2(
+    return _build(
+        ExampleSubmodel2,
         id_short="example_submodel_2_id",
-        integer_attribute=1,
-        string_attribute="string",
-        float_attribute=1.1,
-        literal_attribute="value1",
-        enum_attribute=ExampleEnum.value1,
-        list_attribute=["string1", "string2"],
-        tuple_attribute=("string1", "string2"),
-        set_attribute={"string1", "string2"},
-        union_attribute="string",
+        **_COMMON_ATTRS,
+        list_attribute=_mk_list(),
+        tuple_attribute=(_STRING1, _STRING2),
+        set_attribute=_mk_set(),
         submodel_element_collection_attribute_simple=simple_submodel_element_collection,
         submodel_element_collection_attribute=example_submodel_element_collection,
         union_submodel_element_collection_attribute=example_submodel_element_collection_for_union,
         list_submodel_element_collection_attribute=example_list_submodel_element_collection,
     )
 
-@pytest.fixture(scope="function")
-def example_submodel_for_union(simple_submodel_element_collection: SubmodelElementCollection, example_submodel_element_collection: SubmodelElementCollection, example_submodel_element_collection_for_union: SubmodelElementCollection, example_list_submodel_element_collection: List[SubmodelElementCollection]) -> Submodel:
-    return ExampleSubmodel(
-        id_short="example_submodel_for_union_id",
-        integer_attribute=1,
-        string_attribute="string",
-        float_attribute=1.1,
-        literal_attribute="value1",
-        enum_attribute=ExampleEnum.value1,
-        list_attribute=["string1_list", "string2_list"],
-        tuple_attribute=("string1_tuple", "string2_tuple"),
-        set_attribute={"string1_set", "string2_set"},
-        union_attribute="string",
-        submodel_element_collection_attribute_simple=simple_submodel_element_collection,
-        submodel_element_collection_attribute=example_submodel_element_collection,
-        union_submodel_element_collection_attribute=example_submodel_element_collection_for_union,
-        list_submodel_element_collection_attribute=example_list_submodel_element_collection,
-    )
 
-@pytest.fixture(scope="function")
-def example_optional_submodel(simple_submodel_element_collection: SubmodelElementCollection, example_submodel_element_collection: SubmodelElementCollection, example_submodel_element_collection_for_union: SubmodelElementCollection, example_list_submodel_element_collection: List[SubmodelElementCollection]) -> Submodel:
-    return ExampleSubmodel(
-        id_short="example_optional_submodel_id",
-        integer_attribute=1,
-        string_attribute="string",
-        float_attribute=1.1,
-        literal_attribute="value1",
-        enum_attribute=ExampleEnum.value1,
-        list_attribute=["string1_list", "string2_list"],
-        tuple_attribute=("string1_tuple", "string2_tuple"),
-        set_attribute={"string1_set", "string2_set"},
-        union_attribute="string",
-        submodel_element_collection_attribute_simple=simple_submodel_element_collection,
-        submodel_element_collection_attribute=example_submodel_element_collection,
-        union_submodel_element_collection_attribute=example_submodel_element_collection_for_union,
-        list_submodel_element_collection_attribute=example_list_submodel_element_collection,
-    )
+@pytest.fixture(scope="session")
+def example_submodel_for_union(_submodel_factory: Callable[..., ExampleSubmodel]) -> Submodel:
+    return _submodel_factory("example_submodel_for_union_id")
+
+
+@pytest.fixture(scope="session")
+def example_optional_submodel(_submodel_factory: Callable[..., ExampleSubmodel]) -> Submodel:
+    return _submodel_factory("example_optional_submodel_id")
 
 
 @pytest.fixture(scope="function")
 def example_submodel_with_reference() -> ExampleSubmodelWithReference:
-    return ExampleSubmodelWithReference(
-        id_short="example_submodel_with_reference_components_id",
-        single_reference="referenced_aas_1_id",
-        list_references=["referenced_aas_1_id", "referenced_aas_2_id"],
-        tuple_references=("referenced_aas_1_id", "referenced_aas_2_id"),
-        set_references={"referenced_aas_1_id", "referenced_aas_2_id"},
+    return _fresh(
+        _build_submodel_with_reference("example_submodel_with_reference_components_id")
     )
 
 
 @pytest.fixture(scope="function")
 def example_submodel_with_id_reference() -> ExampleSubmodelWithIdReference:
-    return ExampleSubmodelWithIdReference(
-        id_short="example_submodel_with_id_reference_components_id",
-        referenced_aas_id="referenced_aas_1_id",
-        referenced_aas_ids=["referenced_aas_1_id", "referenced_aas_2_id"],
-        referenced_aas_tuple_ids=("referenced_aas_1_id", "referenced_aas_2_id"),
-        referenced_aas_set_ids={"referenced_aas_1_id", "referenced_aas_2_id"},
+    return _fresh(
+        _build_submodel_with_id_reference(
+            "example_submodel_with_id_reference_components_id"
+        )
     )
 
 
@@ -333,68 +446,65 @@ def example_submodel_with_product_association(
     )
 
 
-@pytest.fixture(scope="function")
-def example_aas(example_submodel: ExampleSubmodel, example_submodel_2: ExampleSubmodel2, example_submodel_for_union: ExampleSubmodel, example_optional_submodel: ExampleSubmodel) -> AAS:
-    return ValidAAS(
-        id_short="valid_aas_id",
-        example_submodel=example_submodel,
+@pytest.fixture(scope="session")
+def _base_aas(_canonical_submodel: ExampleSubmodel, example_submodel_2: ExampleSubmodel2, example_submodel_for_union: ExampleSubmodel, example_optional_submodel: ExampleSubmodel) -> ValidAAS:
+    return _build(
+        ValidAAS,
+        id_short="base_aas_id",
+        example_submodel=_canonical_submodel,
         example_submodel_2=example_submodel_2,
         union_submodel=example_submodel_for_union,
         optional_submodel=example_optional_submodel,
     )
 
 
+@pytest.fixture(scope="session")
+def _base_aas_pickle(_base_aas: ValidAAS) -> bytes:
+    return pickle.dumps(_base_aas, protocol=pickle.HIGHEST_PROTOCOL)
+
+
 @pytest.fixture(scope="function")
-def referenced_aas_1(example_submodel: ExampleSubmodel, example_submodel_2: ExampleSubmodel2, example_submodel_for_union: ExampleSubmodel, example_optional_submodel: ExampleSubmodel) -> AAS:
-    return ValidAAS(
-        id_short="referenced_aas_1_id",
-        example_submodel=example_submodel,
-        example_submodel_2=example_submodel_2,
-        union_submodel=example_submodel_for_union, 
-        optional_submodel=example_optional_submodel,       
+def example_aas(_base_aas_pickle: bytes) -> AAS:
+    aas = pickle.loads(_base_aas_pickle)
+    aas.id = "valid_aas_id"
+    aas.id_short = "valid_aas_id"
+    return aas
+
+
+@pytest.fixture(scope="session")
+def referenced_aas_1(_base_aas: ValidAAS) -> AAS:
+    return _base_aas.model_copy(
+        update={"id": _REFERENCED_AAS_1_ID, "id_short": _REFERENCED_AAS_1_ID}
     )
 
 
-@pytest.fixture(scope="function")
-def referenced_aas_2(example_submodel: ExampleSubmodel, example_submodel_2: ExampleSubmodel2, example_submodel_for_union: ExampleSubmodel, example_optional_submodel: ExampleSubmodel) -> AAS:
-    return ValidAAS(
-        id_short="referenced_aas_2_id",
-        example_submodel=example_submodel,
-        example_submodel_2=example_submodel_2,
-        union_submodel=example_submodel_for_union,
-        optional_submodel=example_optional_submodel,
+@pytest.fixture(scope="session")
+def referenced_aas_2(_base_aas: ValidAAS) -> AAS:
+    return _base_aas.model_copy(
+        update={"id": _REFERENCED_AAS_2_ID, "id_short": _REFERENCED_AAS_2_ID}
     )
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def example_basemodel_with_id() -> ExampleBaseMdelWithId:
-    return ExampleBaseMdelWithId(
+    return _build(
+        ExampleBaseMdelWithId,
         id="example_basemodel_with_id",
-        integer_attribute=1,
-        string_attribute="string",
-        float_attribute=1.1,
-        literal_attribute="value1",
-        enum_attribute=ExampleEnum.value1,
-        list_attribute=["string1", "string2"],
-        tuple_attribute=("string1", "string2"),
-        set_attribute={"string1", "string2"},
-        union_attribute="string",
+        **_COMMON_ATTRS,
+        list_attribute=_mk_list(),
+        tuple_attribute=(_STRING1, _STRING2),
+        set_attribute=_mk_set(),
     )
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def example_object_with_id() -> ObjectBomWithId:
     return ObjectBomWithId(
         id="example_object_with_id", 
-        integer_attribute=1,
-        string_attribute="string",
-        float_attribute=1.1,
-        literal_attribute="value1",
-        enum_attribute=ExampleEnum.value1,
-        list_attribute=["string1", "string2"],
-        tuple_attribute=("string1", "string2"),
-        set_attribute={"string1", "string2"},
-        union_attribute="string",
+        **_COMMON_ATTRS,
+        list_attribute=_mk_list(),
+        tuple_attribute=(_STRING1, _STRING2),
+        set_attribute=_mk_set(),
     )
 
 
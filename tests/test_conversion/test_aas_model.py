@@ -96,3 +96,13 @@ def test_faulty_aas(faulty_aas: Type[AAS]):
         assert False
     except ValidationError as e:
         pass
+
+
+def test_aas_semantic_id_field_is_validated_as_submodel(
+    faulty_aas_with_semantic_id: Type[AAS],
+):
+    try:
+        faulty_aas_with_semantic_id(id="test", semantic_id="test")
+        assert False
+    except ValidationError:
+        pass
@@ -1,6 +1,8 @@
 import copy
 from typing import Any, Dict, Optional
 
+import pytest
+
 from aas_pydantic.aas_model import (
     AAS,
     Submodel,
@@ -70,7 +72,8 @@ def test_convert_simple_submodel_with_template_extraction(example_submodel: Subm
     assert pydantic_model.model_dump() == example_submodel.model_dump()
 
 
-def test_convert_simple_aas(example_aas: AAS):
+@pytest.mark.parametrize("workers", [1, 4])
+def test_convert_simple_aas(example_aas: AAS, workers: int):
     object_store = convert_pydantic_type.convert_model_to_aas_template(
         type(example_aas)
     )
@@ -84,7 +87,40 @@ def test_convert_simple_aas(example_aas: AAS):
 
     object_store_instance = convert_pydantic_model.convert_model_to_aas(example_aas)
     pydantic_instance = convert_aas_instance.convert_object_store_to_pydantic_models(
-        object_store_instance, types=pydantic_type
+        object_store_instance, types=pydantic_type, workers=workers
     )
     assert len(pydantic_instance) == 1
     assert pydantic_instance[0].model_dump() == example_aas.model_dump()
+    assert (
+        type(pydantic_instance[0].example_submodel_2).__name__
+        == type(example_aas.example_submodel_2).__name__
+    )
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_convert_multiple_aas(
+    referenced_aas_1: AAS, referenced_aas_2: AAS, workers: int
+):
+    object_store = convert_pydantic_type.convert_model_to_aas_template(
+        type(referenced_aas_1)
+    )
+    pydantic_type = convert_aas_template.convert_object_store_to_pydantic_types(
+        object_store
+    )
+
+    object_store_instance = convert_pydantic_model.convert_model_to_aas(
+        referenced_aas_1
+    )
+    for identifiable in convert_pydantic_model.convert_model_to_aas(referenced_aas_2):
+        if identifiable.id not in object_store_instance:
+            object_store_instance.add(identifiable)
+    pydantic_instances = convert_aas_instance.convert_object_store_to_pydantic_models(
+        object_store_instance, types=pydantic_type, workers=workers
+    )
+    assert len(pydantic_instances) == 2
+    pydantic_instances_by_id = {
+        pydantic_instance.id: pydantic_instance
+        for pydantic_instance in pydantic_instances
+    }
+    for aas in (referenced_aas_1, referenced_aas_2):
+        assert pydantic_instances_by_id[aas.id].model_dump() == aas.model_dump()
@@ -0,0 +1,59 @@
+from basyx.aas import model
+
+from aas_pydantic import convert_pydantic_type, convert_util
+from aas_pydantic.aas_model import Submodel
+
+
+def _class_data_specification(
+    submodel_id: str, class_name: str
+) -> model.EmbeddedDataSpecification:
+    return model.EmbeddedDataSpecification(
+        data_specification=model.ExternalReference(
+            key=(model.Key(type_=model.KeyTypes.GLOBAL_REFERENCE, value=submodel_id),),
+        ),
+        data_specification_content=model.DataSpecificationIEC61360(
+            preferred_name=model.LangStringSet({"en": "class"}),
+            value=class_name,
+        ),
+    )
+
+
+def test_data_specification_index_is_rebuilt_after_changes():
+    submodel = model.Submodel(
+        id_="example_submodel_id",
+        id_short="example_submodel_id",
+        embedded_data_specifications=[
+            _class_data_specification("example_submodel_id", "A")
+        ],
+    )
+    assert convert_util.get_class_name_from_basyx_model(submodel) == "A"
+
+    submodel.embedded_data_specifications[0] = _class_data_specification(
+        "example_submodel_id", "B"
+    )
+    assert convert_util.get_class_name_from_basyx_model(submodel) == "B"
+
+    submodel.embedded_data_specifications.insert(
+        0, _class_data_specification("example_submodel_id", "C")
+    )
+    assert convert_util.get_class_name_from_basyx_model(submodel) == "C"
+
+    submodel.embedded_data_specifications = [
+        _class_data_specification("example_submodel_id", "D")
+    ]
+    assert convert_util.get_class_name_from_basyx_model(submodel) == "D"
+
+
+def test_data_specification_preferred_names_are_not_shared(example_submodel: Submodel):
+    template = convert_pydantic_type.convert_model_to_submodel_template(
+        type(example_submodel)
+    )
+    for data_specification in template.embedded_data_specifications:
+        data_specification.data_specification_content.preferred_name["de"] = "Klasse"
+
+    other_template = convert_pydantic_type.convert_model_to_submodel_template(
+        type(example_submodel)
+    )
+    assert other_template.embedded_data_specifications
+    for data_specification in other_template.embedded_data_specifications:
+        assert "de" not in data_specification.data_specification_content.preferred_name